@@ -1,14 +1,26 @@
 import argparse
+import io
 import json
 import os
-import re
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+	import orjson  # type: ignore
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+	orjson = None
+
+# Punctuation the ERB template strips from anchors
+_SLUG_STRIP = str.maketrans("", "", "`~!@#$%^&*()+=<>?,./:;\"'|{}[]\\–—")
 
 
 def read_json(path: str) -> dict:
 	"""Read a JSON file and return the parsed object."""
-	with open(path, "r", encoding="utf-8") as f:
-		return json.load(f)
+	with open(path, "rb") as f:
+		data = f.read()
+	if orjson is not None:
+		return orjson.loads(data)
+	return json.loads(data)
 
 
 def write_text(path: str, content: str) -> None:
@@ -17,6 +29,7 @@ def write_text(path: str, content: str) -> None:
 		f.write(content)
 
 
+@lru_cache(maxsize=32)
 def get_language(executor_name: str) -> str:
 	"""Map executor name to code fence language."""
 	if executor_name == "command_prompt":
@@ -28,6 +41,11 @@ def get_language(executor_name: str) -> str:
 
 def format_supported_platforms(platforms: List[str]) -> str:
 	"""Render supported platforms like the ERB template (macOS special case, others capitalize)."""
+	return _format_platforms(tuple(platforms))
+
+
+@lru_cache(maxsize=64)
+def _format_platforms(platforms: Tuple[str, ...]) -> str:
 	display = []
 	for p in platforms:
 		if p == "macos":
@@ -44,9 +62,7 @@ def slugify_anchor(title: str) -> str:
 	- spaces -> '-'
 	- strip the set of punctuation used in template
 	"""
-	lower = title.lower().replace(" ", "-")
-	# remove characters: [`~!@#$%^&*()+=<>?,./:;"'|{}\[\]\\–—]
-	return re.sub(r"[`~!@#$%^&*()+=<>?,\./:;\"'\|\{\}\[\]\\\\–—]", "", lower)
+	return title.lower().replace(" ", "-").translate(_SLUG_STRIP)
 
 
 def escape_table_cell(value: Optional[str]) -> str:
@@ -59,83 +75,71 @@ def escape_table_cell(value: Optional[str]) -> str:
 	return value.replace("\\", "&#92;")
 
 
-def render_inputs_table(input_arguments: Optional[List[Dict]]) -> str:
+def render_inputs_table(input_arguments: Optional[List[Dict]], buf: io.StringIO) -> None:
 	if not input_arguments:
-		return ""
-	lines: List[str] = []
-	lines.append("#### Inputs:")
-	lines.append("| Name | Description | Type | Default Value |")
-	lines.append("|------|-------------|------|---------------|")
-	for arg in input_arguments:
-		name = escape_table_cell(arg.get("arg_name"))
-		desc = escape_table_cell(arg.get("description"))
-		typ = escape_table_cell(arg.get("type"))
-		default = escape_table_cell(arg.get("default"))
-		lines.append(f"| {name} | {desc} | {typ} | {default}|")
-	return "\n".join(lines) + "\n"
-
-
-def render_executor_block(executor: Dict) -> str:
+		return
+	esc = escape_table_cell
+	rows = (
+		f"| {esc(a.get('arg_name'))} | {esc(a.get('description'))} | {esc(a.get('type'))} | {esc(a.get('default'))}|"
+		for a in input_arguments
+	)
+	buf.write(
+		"#### Inputs:\n"
+		"| Name | Description | Type | Default Value |\n"
+		"|------|-------------|------|---------------|\n" + "\n".join(rows) + "\n"
+	)
+
+
+ELEVATION_TAG = "  Elevation Required (e.g. root or admin) "
+
+
+def render_executor_block(executor: Dict, buf: io.StringIO) -> None:
 	"""Render executor section similar to ERB output."""
 	name = executor.get("name", "")
-	elev = bool(executor.get("elevation_required", False))
-	procedure = executor.get("procedure", "") or ""
+	elev_tag = ELEVATION_TAG if executor.get("elevation_required", False) else ""
+	procedure = (executor.get("procedure", "") or "").strip()
 	cleanup = executor.get("cleanup_command")
 
-	parts: List[str] = []
 	if name == "manual":
-		heading = "#### Run it with these steps!"
-		if elev:
-			heading += "  Elevation Required (e.g. root or admin) "
-		parts.append(heading)
-		parts.append("")
-		parts.append(procedure.strip())
-	else:
-		heading = f"#### Attack Commands: Run with `{name}`!"
-		if elev:
-			heading += "  Elevation Required (e.g. root or admin) "
-		parts.append(heading)
-		parts.append("")
-		lang = get_language(name)
-		parts.append(f"```{lang}")
-		parts.append(procedure.strip())
-		parts.append("```")
-		if cleanup:
-			parts.append("")
-			parts.append("#### Cleanup Commands:")
-			parts.append(f"```{lang}")
-			parts.append(str(cleanup).strip())
-			parts.append("```")
-	return "\n".join(parts) + "\n"
-
-
-def render_dependencies(dependencies: Optional[List[Dict]], executor_name: str, dep_executor_name: Optional[str]) -> str:
+		if procedure:
+			buf.write(f"#### Run it with these steps!{elev_tag}\n\n{procedure}\n")
+		else:
+			# Nothing follows the heading, so it is the end of the block
+			buf.write(f"#### Run it with these steps!{elev_tag.rstrip()}\n")
+		return
+	lang = get_language(name)
+	cleanup_section = f"\n#### Cleanup Commands:\n```{lang}\n{str(cleanup).strip()}\n```\n" if cleanup else ""
+	buf.write(
+		f"#### Attack Commands: Run with `{name}`!{elev_tag}\n\n"
+		f"```{lang}\n{procedure}\n```\n"
+		f"{cleanup_section}"
+	)
+
+
+def render_dependencies(
+	dependencies: Optional[List[Dict]], executor_name: str, dep_executor_name: Optional[str], buf: io.StringIO
+) -> None:
 	if not dependencies:
-		return ""
-	parts: List[str] = []
+		return
 	exec_to_use = dep_executor_name or executor_name
-	parts.append(f"#### Dependencies:  Run with `{exec_to_use}`!")
+	buf.write(f"#### Dependencies:  Run with `{exec_to_use}`!\n")
 	lang = get_language(exec_to_use)
 	for dep in dependencies:
-		desc = dep.get("description", "").strip()
-		prereq = dep.get("prereq_command", "")
 		get_prereq = dep.get("get_prereq_command")
-		parts.append(f"##### Description: {desc}")
-		parts.append("##### Check Prereq Commands:")
-		parts.append(f"```{lang}")
-		parts.append(str(prereq).strip())
-		parts.append("```")
-		if get_prereq:
-			parts.append("##### Get Prereq Commands:")
-			parts.append(f"```{lang}")
-			parts.append(str(get_prereq).strip())
-			parts.append("```")
-	return "\n".join(parts) + "\n"
-
-
-def render_atomic_markdown(obj: dict) -> str:
+		get_section = (
+			f"##### Get Prereq Commands:\n```{lang}\n{str(get_prereq).strip()}\n```\n" if get_prereq else ""
+		)
+		buf.write(
+			f"##### Description: {dep.get('description', '').strip()}\n"
+			f"##### Check Prereq Commands:\n"
+			f"```{lang}\n{str(dep.get('prereq_command', '')).strip()}\n```\n"
+			f"{get_section}"
+		)
+
+
+def render_atomic_markdown(obj: dict, buf: io.StringIO) -> None:
 	"""
-	Render the Markdown for a single technique object following the Atomic docs style.
+	Render the Markdown for a single technique object following the Atomic docs style into buf.
 	Note: top-level ATT&CK description block is emitted only if 'description' is provided.
 	"""
 	attack_technique = obj.get("attack_technique", "")
@@ -143,62 +147,61 @@ def render_atomic_markdown(obj: dict) -> str:
 	technique_desc = obj.get("description")  # optional
 	atomic_tests: List[Dict] = obj.get("atomic_tests", [])
 
-	out: List[str] = []
-	out.append(f"# {attack_technique} - {display_name}")
+	buf.write(f"# {attack_technique} - {display_name}\n")
 	if attack_technique:
 		link_id = attack_technique.replace(".", "/")
-		out.append(f"## [Description from ATT&CK](https://attack.mitre.org/techniques/{link_id})")
-		out.append("<blockquote>")
-		out.append("")
+		buf.write(f"## [Description from ATT&CK](https://attack.mitre.org/techniques/{link_id})\n")
+		buf.write("<blockquote>\n\n")
 		if technique_desc:
-			out.append(str(technique_desc))
-			out.append("")
-		out.append("</blockquote>")
-	out.append("")
-	out.append("## Atomic Tests")
-	out.append("")
-	# Index of tests
+			buf.write(f"{technique_desc}\n\n")
+		buf.write("</blockquote>\n")
+	buf.write("\n## Atomic Tests\n")
+	if not atomic_tests:
+		return
+	buf.write("\n")
+	# Titles and anchors are built once and shared by the index and the test bodies
+	entries = []
 	for idx, test in enumerate(atomic_tests, start=1):
 		title = f"Atomic Test #{idx} - {test.get('name', '')}"
-		anchor = f"#{slugify_anchor(title)}"
-		out.append(f"- [{title}]({anchor})")
-	out.append("")
+		entries.append((idx, title, slugify_anchor(title), test))
+	# Index of tests
+	for _, title, anchor, _ in entries:
+		buf.write(f"- [{title}](#{anchor})\n")
+	buf.write("\n")
 	# Each test
-	for idx, test in enumerate(atomic_tests, start=1):
-		out.append("<br/>")
-		out.append("")
-		out.append(f"## Atomic Test #{idx} - {test.get('name', '')}")
+	for idx, title, _, test in entries:
+		if idx > 1:
+			buf.write("<br/>\n")
+		buf.write(f"<br/>\n\n## {title}\n")
 		desc = (test.get("description") or "").strip()
 		if desc:
-			out.append(desc)
-		out.append("")
+			buf.write(f"{desc}\n")
+		buf.write("\n")
 		# Supported platforms
 		plats = test.get("supported_platforms") or []
-		out.append(f"**Supported Platforms:** {format_supported_platforms(plats)}")
-		out.append("")
+		buf.write(f"**Supported Platforms:** {format_supported_platforms(plats)}\n\n")
 		# auto_generated_guid (optional if present)
 		if "auto_generated_guid" in test and test.get("auto_generated_guid"):
-			out.append(f"**auto_generated_guid:** {test['auto_generated_guid']}")
-			out.append("")
+			buf.write(f"**auto_generated_guid:** {test['auto_generated_guid']}\n\n")
 		# Inputs table
-		inputs_section = render_inputs_table(test.get("input_arguments"))
-		if inputs_section:
-			out.append(inputs_section.rstrip())
-			out.append("")
+		input_arguments = test.get("input_arguments")
+		if input_arguments:
+			render_inputs_table(input_arguments, buf)
+			buf.write("\n")
 		# Executor
-		out.append(render_executor_block(test.get("executor") or {}).rstrip())
-		out.append("")
+		render_executor_block(test.get("executor") or {}, buf)
+		buf.write("\n")
 		# Dependencies
-		dep_block = render_dependencies(
-			test.get("dependencies"),
-			(test.get("executor") or {}).get("name", ""),
-			test.get("dependency_executor_name"),
-		)
-		if dep_block:
-			out.append(dep_block.rstrip())
-			out.append("")
-		out.append("<br/>")
-	return "\n".join(out).rstrip() + "\n"
+		dependencies = test.get("dependencies")
+		if dependencies:
+			render_dependencies(
+				dependencies,
+				(test.get("executor") or {}).get("name", ""),
+				test.get("dependency_executor_name"),
+				buf,
+			)
+			buf.write("\n")
+	buf.write("<br/>\n")
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -213,7 +216,9 @@ def main(argv: Optional[List[str]] = None) -> int:
 	parser = build_arg_parser()
 	args = parser.parse_args(argv)
 	obj = read_json(args.input)
-	md = render_atomic_markdown(obj)
+	buf = io.StringIO()
+	render_atomic_markdown(obj, buf)
+	md = buf.getvalue()
 	if args.stdout:
 		print(md, end="")
 		return 0
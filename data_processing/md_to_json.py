@@ -1,11 +1,17 @@
 import argparse
+import concurrent.futures
 import json
 import os
 import re
 import sys
-from dataclasses import dataclass
+from bisect import bisect_left
 from html import unescape
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 
 def ensure_project_root_on_syspath() -> None:
@@ -19,8 +25,7 @@ def ensure_project_root_on_syspath() -> None:
         sys.path.insert(0, project_root)
 
 
-@dataclass
-class CodeBlock:
+class CodeBlock(NamedTuple):
     language: str
     content: str
 
@@ -48,6 +53,70 @@ PLATFORM_REVERSE_MAP = {
     "Containers": "containers",
     "ESXi": "esxi",
 }
+# Display names and their lowercased forms, so already-lowercased platforms still map
+_PLATFORM_LOOKUP = {**{k.lower(): v for k, v in PLATFORM_REVERSE_MAP.items()}, **PLATFORM_REVERSE_MAP}
+
+RE_TECH_HEADER = re.compile(r"^#\s+([Tt]\d{4}(?:\.\d{3})?)\s*-\s*(.+?)\s*$", re.MULTILINE)
+RE_SECTION_SPLIT = re.compile(r"^##\s+Atomic Test\s+#\d+\s+-\s+(.+)$", re.MULTILINE)
+RE_PLATFORMS = re.compile(r"^\*\*Supported Platforms:\*\*\s*(.+?)\s*$", re.MULTILINE)
+RE_GUID = re.compile(r"^\*\*auto_generated_guid:\*\*\s*([0-9a-fA-F-]{36})\s*$", re.MULTILINE)
+RE_INPUTS_TABLE = re.compile(
+    r"^####\s+Inputs:\s*\n(?P<header>\|.+\|\s*\n\|[-\s|]+\|\s*\n)(?P<body>(?:\|.*\|\s*\n)+)",
+    re.MULTILINE,
+)
+RE_CODEFENCE_OPEN = re.compile(r"```([a-zA-Z0-9_-]*)\s*\n", re.MULTILINE)
+RE_CODEFENCE_CLOSE = re.compile(r"^\s*```", re.MULTILINE)
+RE_MANUAL_HEADING = re.compile(
+    r"^####\s+Run it with these steps!\s*(?P<elev>Elevation Required.*)?$",
+    re.MULTILINE,
+)
+RE_MANUAL_START = re.compile(r"^####\s+Run it with these steps!.*$", re.MULTILINE)
+RE_CMD_HEADING = re.compile(
+    r"^####\s+Attack Commands:\s+Run with\s+`(?P<exec>[^`]+)`!\s*(?P<elev>Elevation Required.*)?$",
+    re.MULTILINE,
+)
+RE_CLEANUP = re.compile(r"^####\s+Cleanup Commands:\s*$", re.MULTILINE)
+RE_DEP_HEADING = re.compile(r"^####\s+Dependencies:\s+Run with\s+`(?P<dep_exec>[^`]+)`!", re.MULTILINE)
+RE_DESC = re.compile(r"^#####\s+Description:\s*(?P<desc>.+)$", re.MULTILINE)
+RE_CHECK = re.compile(r"^#####\s+Check Prereq Commands:\s*$", re.MULTILINE)
+RE_GET = re.compile(r"^#####\s+Get Prereq Commands:\s*$", re.MULTILINE)
+# Line-start markers of a test section. Each alternative consumes only its literal prefix
+# (the rest is a lookahead) so one finditer pass can never swallow the start of a later line.
+RE_TOKENS = re.compile(
+    r"^(?:"
+    r"(?P<plats>\*\*Supported Platforms:\*\*)"
+    r"|(?P<guid>\*\*auto_generated_guid:\*\*)"
+    r"|(?P<desc>#####(?=\s+Description:))"
+    r"|(?P<check>#####(?=\s+Check Prereq Commands:))"
+    r"|(?P<get>#####(?=\s+Get Prereq Commands:))"
+    r"|(?P<inputs>####(?=\s+Inputs:))"
+    r"|(?P<manual>####(?=\s+Run it with these steps!))"
+    r"|(?P<cmd>####(?=\s+Attack Commands:))"
+    r"|(?P<cleanup>####(?=\s+Cleanup Commands:))"
+    r"|(?P<deps>####(?=\s+Dependencies:))"
+    r"|(?P<h4>####(?=\s))"
+    r"|(?P<h2>##(?=\s))"
+    r")",
+    re.MULTILINE,
+)
+# Token kinds that start with '^####\s'
+H4_KINDS = frozenset({"inputs", "manual", "cmd", "cleanup", "deps", "h4"})
+# Section terminators for extract_between
+END_AFTER_TITLE = H4_KINDS | {"plats", "h2"}
+END_MANUAL = H4_KINDS | {"h2"}
+RE_T_DIR = re.compile(r"^T\d{4}(?:\.\d{3})?$")
+RE_T_FILE = re.compile(r"^T\d{4}(?:\.\d{3})?\.md$", re.IGNORECASE)
+
+# The markdown emitter only ever escapes backslashes (as &#92;). Set to True to run the full
+# html.unescape instead, e.g. for hand-edited markdown that uses other HTML entities.
+FULL_HTML_UNESCAPE = False
+
+
+def _unescape_bs(value: str) -> str:
+    """Undo the emitter's backslash escaping in table cells, code blocks and descriptions."""
+    if FULL_HTML_UNESCAPE:
+        return unescape(value)
+    return value.replace("&#92;", "\\")
 
 
 def read_text(path: str) -> str:
@@ -55,7 +124,26 @@ def read_text(path: str) -> str:
         return f.read()
 
 
+def read_json(path: str) -> dict:
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: dict) -> str:
+    """Serialize data as 2-space indented JSON with non-ASCII characters kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
 def write_json(path: str, data: dict) -> None:
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -66,48 +154,81 @@ def parse_technique_header(text: str) -> Tuple[str, str]:
     Returns (attack_technique, display_name)
     """
     # Match beginning of file heading
-    m = re.search(r"^#\s+([Tt]\d{4}(?:\.\d{3})?)\s*-\s*(.+?)\s*$", text, re.MULTILINE)
+    m = RE_TECH_HEADER.search(text)
     if not m:
         raise ValueError("Unable to find technique header '# Txxxx - Name' in markdown.")
     return m.group(1).upper(), m.group(2).strip()
 
 
-def split_atomic_tests_sections(text: str) -> List[Tuple[str, str]]:
+def split_atomic_tests_sections(text: str) -> List[Tuple[int, int]]:
     """
-    Splits the document into atomic test sections.
-    Returns list of tuples: (section_title_line, section_text)
-    Section title line looks like: '## Atomic Test #<n> - <name>'
+    Splits the document into atomic test sections without copying them.
+    Returns list of (start, end) offsets into text; each section begins with its title line,
+    which looks like: '## Atomic Test #<n> - <name>'
     """
-    pattern = re.compile(r"^##\s+Atomic Test\s+#\d+\s+-\s+.+$", re.MULTILINE)
-    matches = list(pattern.finditer(text))
-    sections: List[Tuple[str, str]] = []
-    for i, match in enumerate(matches):
-        start = match.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-        section_text = text[start:end]
-        first_line = section_text.splitlines()[0]
-        sections.append((first_line, section_text))
-    return sections
-
-
-def extract_between(section: str, start_regex: str, end_regexes: List[str]) -> Tuple[Optional[str], int, int]:
+    starts = [m.start() for m in RE_SECTION_SPLIT.finditer(text)]
+    return list(zip(starts, starts[1:] + [len(text)]))
+
+
+class SectionTokens:
+    """
+    Index of the line-start markers of one test section text[start:end], built with a single
+    RE_TOKENS pass. Parsers look up candidate positions by kind and run their full pattern only
+    there, instead of each scanning the whole section. All positions are offsets into text.
+    """
+
+    def __init__(self, text: str, start: int, end: int):
+        self.text = text
+        self.start = start
+        self.end = end
+        self.positions: List[int] = []
+        self.kinds: List[str] = []
+        self.by_kind: Dict[str, List[int]] = {}
+        for m in RE_TOKENS.finditer(text, start, end):
+            kind = m.lastgroup
+            self.positions.append(m.start())
+            self.kinds.append(kind)
+            self.by_kind.setdefault(kind, []).append(m.start())
+
+    def has(self, kind: str) -> bool:
+        return kind in self.by_kind
+
+    def match(self, pattern: re.Pattern, kind: str, start: Optional[int] = None) -> Optional[re.Match]:
+        """First match of pattern anchored at a token of the given kind at or after start."""
+        positions = self.by_kind.get(kind)
+        if not positions:
+            return None
+        if start is None:
+            start = self.start
+        for pos in positions[bisect_left(positions, start):]:
+            m = pattern.match(self.text, pos, self.end)
+            if m:
+                return m
+        return None
+
+    def boundary(self, kinds: FrozenSet[str], start: int) -> int:
+        """Position of the first token in kinds at or after start, or the end of the section."""
+        for i in range(bisect_left(self.positions, start), len(self.positions)):
+            if self.kinds[i] in kinds:
+                return self.positions[i]
+        return self.end
+
+
+def extract_between(
+    tokens: SectionTokens, start_pat: re.Pattern, start_kind: str, end_kinds: FrozenSet[str]
+) -> Tuple[Optional[str], int, int]:
     """
-    Extracts text after the first line that matches start_regex until the next line that matches any of end_regexes,
-    or until the end of the section. Returns (content or None if not found, start_index, end_index).
-    Indices are positions in the section string (0-based).
+    Extracts text after the first line that matches start_pat (a start_kind token) until the next
+    token whose kind is in end_kinds, or until the end of the section.
+    Returns (content or None if not found, start_index, end_index).
+    Indices are offsets into the document text.
     """
-    start_match = re.search(start_regex, section, re.MULTILINE)
+    start_match = tokens.match(start_pat, start_kind)
     if not start_match:
         return None, -1, -1
     search_start = start_match.end()
-    # Find earliest end among end_regexes after search_start
-    end_positions = []
-    for er in end_regexes:
-        m = re.search(er, section[search_start:], re.MULTILINE)
-        if m:
-            end_positions.append(search_start + m.start())
-    end_pos = min(end_positions) if end_positions else len(section)
-    content = section[search_start:end_pos]
+    end_pos = tokens.boundary(end_kinds, search_start)
+    content = tokens.text[search_start:end_pos]
     return content.strip(), start_match.start(), end_pos
 
 def restructure_input_arguments_in_technique(technique: dict) -> dict:
@@ -119,19 +240,12 @@ def restructure_input_arguments_in_technique(technique: dict) -> dict:
     atomic_tests = technique.get("atomic_tests") or []
     for t in atomic_tests:
         args_map = t.get("input_arguments")
-        if isinstance(args_map, dict):
-            items: List[dict] = []
-            for name, meta in args_map.items():
-                item = {"arg_name": name}
-                if isinstance(meta, dict):
-                    # preserve keys: description, type, default
-                    for k, v in meta.items():
-                        item[k] = v
-                items.append(item)
-            t["input_arguments"] = items
-        elif args_map in (None, {}):
-            t["input_arguments"] = []
-        # If already a list, leave as-is
+        # preserve keys: description, type, default; if already a list, leave as-is
+        t["input_arguments"] = (
+            [{"arg_name": name, **(meta if isinstance(meta, dict) else {})} for name, meta in args_map.items()]
+            if isinstance(args_map, dict)
+            else ([] if args_map in (None, {}) else args_map)
+        )
     return technique
 
 
@@ -146,55 +260,37 @@ def restructure_executor_in_technique(technique: dict) -> dict:
         executor = t.get("executor")
         if not isinstance(executor, dict):
             continue
-        if "steps" in executor and isinstance(executor.get("steps"), str):
-            executor["procedure"] = executor["steps"]
-            del executor["steps"]
-        elif "command" in executor and isinstance(executor.get("command"), str):
-            executor["procedure"] = executor["command"]
-            del executor["command"]
-        t["executor"] = executor
+        key = next((k for k in ("steps", "command") if isinstance(executor.get(k), str)), None)
+        if key:
+            executor["procedure"] = executor.pop(key)
     return technique
 
 
-def parse_supported_platforms(section: str) -> List[str]:
+def parse_supported_platforms(tokens: SectionTokens) -> List[str]:
     # Example: "**Supported Platforms:** Windows, Linux"
-    m = re.search(r"^\*\*Supported Platforms:\*\*\s*(.+?)\s*$", section, re.MULTILINE)
+    m = tokens.match(RE_PLATFORMS, "plats")
     if not m:
         return []
     raw = m.group(1).strip()
-    parts = [p.strip() for p in raw.split(",")]
-    platforms: List[str] = []
-    for p in parts:
-        if not p:
-            continue
-        # Some templates may print each on its own line, handle that too
-        if p in PLATFORM_REVERSE_MAP:
-            platforms.append(PLATFORM_REVERSE_MAP[p])
-        else:
-            # Fallback: normalize by lowercase; this covers windows/linux and others if already lowercased
-            platforms.append(p.lower())
-    return platforms
+    # Unknown names fall back to their lowercased form
+    return [_PLATFORM_LOOKUP.get(p, p.lower()) for p in (s.strip() for s in raw.split(",")) if p]
 
 
-def parse_auto_generated_guid(section: str) -> Optional[str]:
-    m = re.search(r"^\*\*auto_generated_guid:\*\*\s*([0-9a-fA-F-]{36})\s*$", section, re.MULTILINE)
+def parse_auto_generated_guid(tokens: SectionTokens) -> Optional[str]:
+    m = tokens.match(RE_GUID, "guid")
     return m.group(1) if m else None
 
 
-def parse_inputs_table(section: str) -> Dict[str, Dict[str, Optional[str]]]:
+def parse_inputs_table(tokens: SectionTokens) -> Dict[str, Dict[str, Optional[str]]]:
     """
     Parses the optional Inputs table.
     Returns dict: name -> { description, type, default }
     """
     # Find the heading first
-    if not re.search(r"^####\s+Inputs:", section, re.MULTILINE):
+    if not tokens.has("inputs"):
         return {}
     # Capture table block: lines starting with '|' until a blank line or next heading
-    table_match = re.search(
-        r"^####\s+Inputs:\s*\n(?P<header>\|.+\|\s*\n\|[-\s|]+\|\s*\n)(?P<body>(?:\|.*\|\s*\n)+)",
-        section,
-        re.MULTILINE,
-    )
+    table_match = tokens.match(RE_INPUTS_TABLE, "inputs")
     if not table_match:
         return {}
     body = table_match.group("body")
@@ -208,13 +304,13 @@ def parse_inputs_table(section: str) -> Dict[str, Dict[str, Optional[str]]]:
         if len(cells) < 4:
             continue
         name, desc, typ, default = cells[:4]
-        name = unescape(name)
-        desc = unescape(desc)
-        typ = unescape(typ)
-        default = unescape(default)
+        name = _unescape_bs(name)
+        desc = _unescape_bs(desc)
+        typ = _unescape_bs(typ)
+        default = _unescape_bs(default)
         # Rows often end without trailing space before '|', ensure we strip it
         if default.endswith("\\"):
-            # nothing special, keep as is; backslashes were unescaped via html earlier
+            # nothing special, keep as is; backslashes were unescaped above
             pass
         args[name] = {
             "description": desc,
@@ -224,41 +320,34 @@ def parse_inputs_table(section: str) -> Dict[str, Dict[str, Optional[str]]]:
     return args
 
 
-def parse_next_code_block(after_index: int, section: str) -> Optional[CodeBlock]:
+def parse_next_code_block(text: str, start: int, end: int) -> Optional[CodeBlock]:
     """
-    Finds the next fenced code block (```lang ... ```).
+    Finds the next fenced code block (```lang ... ```) within text[start:end].
     Returns CodeBlock or None if not found.
     """
-    m = re.search(r"```([a-zA-Z0-9_-]*)\s*\n", section[after_index:], re.MULTILINE)
+    m = RE_CODEFENCE_OPEN.search(text, start, end)
     if not m:
         return None
     lang = m.group(1)
-    code_start = after_index + m.end()
-    m_end = re.search(r"^\s*```", section[code_start:], re.MULTILINE)
+    code_start = m.end()
+    m_end = RE_CODEFENCE_CLOSE.search(text, code_start, end)
     if not m_end:
         return None
-    code_end = code_start + m_end.start()
-    content = section[code_start:code_end]
-    return CodeBlock(language=lang, content=unescape(content.strip()))
+    code_end = m_end.start()
+    content = text[code_start:code_end]
+    return CodeBlock(language=lang, content=_unescape_bs(content.strip()))
 
 
-def parse_executor_block(section: str) -> Tuple[Dict, int]:
+def parse_executor_block(tokens: SectionTokens) -> Tuple[Dict, int]:
     """
     Parses executor configuration and command/steps.
     Returns (executor_dict, last_parsed_index)
     """
+    text, end = tokens.text, tokens.end
     # Manual steps heading
-    manual_heading = re.search(
-        r"^####\s+Run it with these steps!\s*(?P<elev>Elevation Required.*)?$",
-        section,
-        re.MULTILINE,
-    )
+    manual_heading = tokens.match(RE_MANUAL_HEADING, "manual")
     if manual_heading:
-        steps_text, _, end_idx = extract_between(
-            section,
-            r"^####\s+Run it with these steps!.*$",
-            end_regexes=[r"^####\s", r"^##\s"],
-        )
+        steps_text, _, end_idx = extract_between(tokens, RE_MANUAL_START, "manual", END_MANUAL)
         executor = {
             "name": "manual",
             "elevation_required": manual_heading.group("elev") is not None,
@@ -267,11 +356,7 @@ def parse_executor_block(section: str) -> Tuple[Dict, int]:
         return executor, end_idx
 
     # Command-based executor heading
-    cmd_heading = re.search(
-        r"^####\s+Attack Commands:\s+Run with\s+`(?P<exec>[^`]+)`!\s*(?P<elev>Elevation Required.*)?$",
-        section,
-        re.MULTILINE,
-    )
+    cmd_heading = tokens.match(RE_CMD_HEADING, "cmd")
     if not cmd_heading:
         raise ValueError("Executor heading not found in test section.")
     exec_name_display = cmd_heading.group("exec").strip()
@@ -281,22 +366,21 @@ def parse_executor_block(section: str) -> Tuple[Dict, int]:
     # The backticked name is the canonical executor we want (e.g., 'command_prompt').
     exec_name = exec_name_display
     # Extract the first code block after this heading as command
-    command_block = parse_next_code_block(cmd_heading.end(), section)
+    command_block = parse_next_code_block(text, cmd_heading.end(), end)
     if not command_block:
         raise ValueError("Command code block not found after executor heading.")
     cleanup_cmd: Optional[str] = None
 
     # Optionally a cleanup section appears after
-    cleanup_heading = re.search(r"^####\s+Cleanup Commands:\s*$", section[cmd_heading.end():], re.MULTILINE)
+    cleanup_heading = tokens.match(RE_CLEANUP, "cleanup", cmd_heading.end())
     last_index = cmd_heading.end()
     if cleanup_heading:
-        cleanup_abs_index = cmd_heading.end() + cleanup_heading.end()
-        cleanup_block = parse_next_code_block(cmd_heading.end() + cleanup_heading.start(), section)
+        cleanup_block = parse_next_code_block(text, cleanup_heading.start(), end)
         if cleanup_block:
             cleanup_cmd = cleanup_block.content
-            last_index = cmd_heading.end() + cleanup_heading.start() + len(cleanup_block.content)
+            last_index = cleanup_heading.start() + len(cleanup_block.content)
         else:
-            last_index = cleanup_abs_index
+            last_index = cleanup_heading.end()
     else:
         last_index = cmd_heading.end()
 
@@ -315,16 +399,13 @@ def parse_executor_block(section: str) -> Tuple[Dict, int]:
     return executor, last_index
 
 
-def parse_dependencies(section: str, test_executor_name: str) -> Tuple[Optional[str], List[Dict]]:
+def parse_dependencies(tokens: SectionTokens, test_executor_name: str) -> Tuple[Optional[str], List[Dict]]:
     """
     Parses optional dependencies block.
     Returns (dependency_executor_name or None, dependencies list)
     """
-    dep_heading = re.search(
-        r"^####\s+Dependencies:\s+Run with\s+`(?P<dep_exec>[^`]+)`!",
-        section,
-        re.MULTILINE,
-    )
+    text, end = tokens.text, tokens.end
+    dep_heading = tokens.match(RE_DEP_HEADING, "deps")
     if not dep_heading:
         return None, []
     dep_exec_printed = dep_heading.group("dep_exec").strip()
@@ -335,56 +416,54 @@ def parse_dependencies(section: str, test_executor_name: str) -> Tuple[Optional[
     # We'll iterate sequentially after the heading
     pos = dep_heading.end()
     while True:
-        m_desc = re.search(r"^#####\s+Description:\s*(?P<desc>.+)$", section[pos:], re.MULTILINE)
+        m_desc = tokens.match(RE_DESC, "desc", pos)
         if not m_desc:
             break
-        desc_abs_start = pos + m_desc.start()
         desc_text = m_desc.group("desc").strip()
         # Check prereq block
-        m_check = re.search(r"^#####\s+Check Prereq Commands:\s*$", section[desc_abs_start:], re.MULTILINE)
+        m_check = tokens.match(RE_CHECK, "check", m_desc.start())
         if not m_check:
             break
-        check_block = parse_next_code_block(desc_abs_start + m_check.end(), section)
+        check_block = parse_next_code_block(text, m_check.end(), end)
         # Get prereq block
-        m_get = re.search(r"^#####\s+Get Prereq Commands:\s*$", section[desc_abs_start + m_check.end():], re.MULTILINE)
+        m_get = tokens.match(RE_GET, "get", m_check.end())
         get_block = None
         if m_get:
-            get_block = parse_next_code_block(desc_abs_start + m_check.end() + m_get.end(), section)
+            get_block = parse_next_code_block(text, m_get.end(), end)
 
         deps.append(
             {
-                "description": unescape(desc_text),
+                "description": _unescape_bs(desc_text),
                 "prereq_command": check_block.content if check_block else "",
                 "get_prereq_command": (get_block.content if get_block else None),
             }
         )
         # Advance position beyond the get prereq block if present; otherwise beyond check block
-        advance_from = desc_abs_start + m_check.end()
+        advance_from = m_check.end()
         if m_get and get_block:
             # find the end fence after get_block; we already consumed its content length, but safer to shift a bit
-            advance_from = desc_abs_start + m_check.end() + m_get.end()
+            advance_from = m_get.end()
         pos = advance_from + 1
     return dependency_executor_name, deps
 
 
-def parse_test_section(title_line: str, section: str) -> Dict:
+def parse_test_section(text: str, start: int, end: int) -> Dict:
+    """Parses the atomic test section text[start:end], which begins with its title line."""
+    tokens = SectionTokens(text, start, end)
     # Name from title line
-    m = re.match(r"^##\s+Atomic Test\s+#\d+\s+-\s+(.+)$", title_line)
-    name = m.group(1).strip() if m else "Unknown"
+    title = tokens.match(RE_SECTION_SPLIT, "h2")
+    name = title.group(1).strip() if title else "Unknown"
 
     # Description is text between title and the Supported Platforms line
-    desc_text, _, _ = extract_between(
-        section,
-        r"^##\s+Atomic Test\s+#\d+\s+-\s+.+$",
-        end_regexes=[r"^\*\*Supported Platforms:\*\*", r"^##\s", r"^####\s"],
-    )
-    description = (desc_text or "").strip()
+    description = ""
+    if title:
+        description = text[title.end():tokens.boundary(END_AFTER_TITLE, title.end())].strip()
 
-    supported_platforms = parse_supported_platforms(section)
-    auto_guid = parse_auto_generated_guid(section)
-    input_arguments = parse_inputs_table(section)
-    executor, last_idx = parse_executor_block(section)
-    dep_executor_name, dependencies = parse_dependencies(section, executor["name"])
+    supported_platforms = parse_supported_platforms(tokens)
+    auto_guid = parse_auto_generated_guid(tokens)
+    input_arguments = parse_inputs_table(tokens)
+    executor, last_idx = parse_executor_block(tokens)
+    dep_executor_name, dependencies = parse_dependencies(tokens, executor["name"])
 
     atomic_obj: Dict = {
         "name": name,
@@ -408,7 +487,7 @@ def parse_test_section(title_line: str, section: str) -> Dict:
 def parse_markdown_to_technique(md_text: str) -> Dict:
     attack_technique, display_name = parse_technique_header(md_text)
     sections = split_atomic_tests_sections(md_text)
-    atomic_tests = [parse_test_section(title, sec) for title, sec in sections]
+    atomic_tests = [parse_test_section(md_text, start, end) for start, end in sections]
     technique: Dict = {
         "attack_technique": attack_technique,
         "display_name": display_name,
@@ -423,59 +502,110 @@ def validate_with_json_schema(obj: dict, schema_path: str) -> None:
         from jsonschema.exceptions import ValidationError as JSONSchemaValidationError  # type: ignore
     except Exception as e:
         raise RuntimeError("jsonschema package is required for --schema validation") from e
-    with open(schema_path, "r", encoding="utf-8") as f:
-        schema = json.load(f)
+    schema = read_json(schema_path)
     try:
         jsonschema_validate(instance=obj, schema=schema)
     except JSONSchemaValidationError as e:
         raise ValueError(f"JSON Schema validation failed: {e.message}") from e
 
 
-def process_file(md_path: str, out_path: Optional[str], stdout: bool, schema_path: Optional[str]) -> Optional[str]:
+def process_file(
+    md_path: str,
+    out_path: Optional[str],
+    stdout: bool,
+    schema_path: Optional[str],
+    restruct_args: bool = False,
+    restruct_executor: bool = False,
+) -> Optional[str]:
     text = read_text(md_path)
     technique_obj = parse_markdown_to_technique(text)
-    if getattr(process_file, "_restruct_args", False):
+    if restruct_args:
         technique_obj = restructure_input_arguments_in_technique(technique_obj)
-    if getattr(process_file, "_restruct_executor", False):
+    if restruct_executor:
         technique_obj = restructure_executor_in_technique(technique_obj)
     if schema_path:
         validate_with_json_schema(technique_obj, schema_path)
     if stdout:
-        print(json.dumps(technique_obj, indent=2, ensure_ascii=False))
+        print(dumps_json(technique_obj))
         return None
     output_path = out_path or f"{md_path}.json"
     write_json(output_path, technique_obj)
     return output_path
 
 
-def process_directory(dir_path: str, out_dir: Optional[str], schema_path: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+def _iter_tech_md(root: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (technique_dir, md_filename) for every T*/T*.md file under root, using os.scandir so
+    entry types come from the cached DirEntry. Technique folders are not descended into: their
+    subfolders hold payloads (src/, bin/), not technique docs. Symlinked folders are not followed.
+    """
+    is_tech = RE_T_DIR.match(os.path.basename(root)) is not None
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir():
+            if not is_tech and not entry.is_symlink():
+                yield from _iter_tech_md(entry.path)
+        elif is_tech and RE_T_FILE.match(entry.name):
+            yield root, entry.name
+
+
+def _convert_one(job: Tuple[str, str, Optional[str], bool, bool]) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Worker for process_directory; module-level so it can be pickled into a process pool.
+    job is (md_path, out_path, schema_path, restruct_args, restruct_executor).
+    Returns (md_file, json_output_path or None, error message or None).
+    """
+    md_path, out_path, schema_path, restruct_args, restruct_executor = job
+    try:
+        produced = process_file(
+            md_path,
+            out_path,
+            stdout=False,
+            schema_path=schema_path,
+            restruct_args=restruct_args,
+            restruct_executor=restruct_executor,
+        )
+        return md_path, produced, None
+    except Exception as e:
+        return md_path, None, str(e)
+
+
+def process_directory(
+    dir_path: str,
+    out_dir: Optional[str],
+    schema_path: Optional[str],
+    restruct_args: bool = False,
+    restruct_executor: bool = False,
+    jobs: Optional[int] = None,
+) -> List[Tuple[str, Optional[str]]]:
     """
-    Processes all T*/T*.md files under dir_path.
+    Processes all T*/T*.md files under dir_path, converting files in parallel worker processes.
+    jobs is the number of workers (defaults to the CPU count).
     Returns list of (md_file, json_output_path)
     """
-    results: List[Tuple[str, Optional[str]]] = []
-    for root, dirs, files in os.walk(dir_path):
-        # Only consider technique folders (Txxxx or Txxxx.xxx)
+    work: List[Tuple[str, str, Optional[str], bool, bool]] = []
+    for root, fn in _iter_tech_md(dir_path):
         base = os.path.basename(root)
-        if not re.match(r"^T\d{4}(?:\.\d{3})?$", base):
-            continue
-        for fn in files:
-            if not fn.lower().endswith(".md"):
-                continue
-            if not re.match(r"^T\d{4}(?:\.\d{3})?\.md$", fn, re.IGNORECASE):
-                continue
-            md_path = os.path.join(root, fn)
-            json_name = f"{os.path.splitext(fn)[0]}.json"
-            out_path = os.path.join(out_dir, base, json_name) if out_dir else os.path.join(root, json_name)
-            if out_dir:
-                os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            try:
-                produced = process_file(md_path, out_path, stdout=False, schema_path=schema_path)
-                results.append((md_path, produced))
-            except Exception as e:
+        md_path = os.path.join(root, fn)
+        json_name = f"{os.path.splitext(fn)[0]}.json"
+        out_path = os.path.join(out_dir, base, json_name) if out_dir else os.path.join(root, json_name)
+        if out_dir:
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        work.append((md_path, out_path, schema_path, restruct_args, restruct_executor))
+
+    results: List[Tuple[str, Optional[str]]] = []
+    if not work:
+        return results
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as ex:
+        for md_path, produced, err in ex.map(_convert_one, work, chunksize=16):
+            if err is not None:
                 # Record failure with None output
-                sys.stderr.write(f"Failed to process {md_path}: {e}\n")
-                results.append((md_path, None))
+                sys.stderr.write(f"Failed to process {md_path}: {err}\n")
+            results.append((md_path, produced))
     return results
 
 
@@ -504,6 +634,12 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Normalize executor: move 'steps' (manual) or 'command' into unified 'procedure' key.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Number of worker processes for --dir. Defaults to the number of CPUs.",
+    )
     return parser
 
 
@@ -521,19 +657,30 @@ def main(argv: Optional[List[str]] = None) -> int:
             out_path = args.output
             os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
         try:
-            # Pass restruct flag via function attribute to avoid expanding signatures deeply
-            setattr(process_file, "_restruct_args", bool(args.restruct_args))
-            setattr(process_file, "_restruct_executor", bool(args.restruct_executor))
-            process_file(args.input, out_path, stdout=args.stdout, schema_path=args.schema)
+            process_file(
+                args.input,
+                out_path,
+                stdout=args.stdout,
+                schema_path=args.schema,
+                restruct_args=args.restruct_args,
+                restruct_executor=args.restruct_executor,
+            )
         except Exception as e:
             sys.stderr.write(f"Error: {e}\n")
             return 1
         return 0
 
     if args.dir:
-        setattr(process_file, "_restruct_args", bool(args.restruct_args))
-        setattr(process_file, "_restruct_executor", bool(args.restruct_executor))
-        results = process_directory(args.dir, args.out_dir, schema_path=args.schema)
+        if args.jobs is not None and args.jobs < 1:
+            parser.error("--jobs must be at least 1.")
+        results = process_directory(
+            args.dir,
+            args.out_dir,
+            schema_path=args.schema,
+            restruct_args=args.restruct_args,
+            restruct_executor=args.restruct_executor,
+            jobs=args.jobs,
+        )
         failed = [r for r in results if r[1] is None]
         if failed:
             sys.stderr.write(f"{len(failed)} file(s) failed to convert.\n")